@@ -1,13 +1,62 @@
 # app.py
-import os
+import os, asyncio
+import orjson
+from urllib.parse import unquote
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from fastapi import FastAPI, HTTPException, Query, Header
+from fastapi.responses import ORJSONResponse, StreamingResponse
 from pydantic import BaseModel
-from karriere_scraper import scrape_karriere
+from karriere_scraper import (
+    POOL_SIZE, init_worker, scrape_karriere_using_worker_driver, yield_jobs,
+    init_driver_pool, close_driver_pool, init_job_cache, close_job_cache
+)
 
 API_TOKEN = os.getenv("API_TOKEN", "")
 DEFAULT_PAGE_LIMIT = int(os.getenv("PAGE_LIMIT_DEFAULT", "3"))
+WORKERS = int(os.getenv("WORKERS", "4"))
+
+app = FastAPI(title="Karriere.at Scraper API", version="1.0.0", default_response_class=ORJSONResponse)
+
+# Selenium drivers aren't thread-safe; scrapes run in worker processes that each own a Chrome
+EXECUTOR: ProcessPoolExecutor | None = None
 
-app = FastAPI(title="Karriere.at Scraper API", version="1.0.0")
+def _new_executor() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(
+        max_workers=WORKERS,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=init_worker,
+    )
+
+async def _run_scrape(*args):
+    global EXECUTOR
+    loop = asyncio.get_running_loop()
+    executor = EXECUTOR
+    try:
+        return await loop.run_in_executor(executor, scrape_karriere_using_worker_driver, *args)
+    except BrokenProcessPool:
+        # A worker died (e.g. Chrome took it down); replace the pool once and retry
+        if EXECUTOR is executor:
+            EXECUTOR = _new_executor()
+            executor.shutdown(wait=False)
+        return await loop.run_in_executor(EXECUTOR, scrape_karriere_using_worker_driver, *args)
+
+@app.on_event("startup")
+def _startup():
+    global EXECUTOR
+    EXECUTOR = _new_executor()
+    # Streaming scrapes run in this process: they borrow Selenium fallback drivers from a
+    # bounded pool here (built on first use) and share the on-disk job cache with the workers
+    init_driver_pool(POOL_SIZE)
+    init_job_cache()
+
+@app.on_event("shutdown")
+def _shutdown():
+    if EXECUTOR is not None:
+        EXECUTOR.shutdown(wait=True)
+    close_driver_pool()
+    close_job_cache()
 
 class JobsResponse(BaseModel):
     field: str
@@ -21,7 +70,7 @@ def healthz():
     return {"ok": True}
 
 @app.get("/karriere/search", response_model=JobsResponse)
-def karriere_search(
+async def karriere_search(
     field: str = Query(..., description="e.g., 'IT, EDV'"),
     region: str = Query(..., description="e.g., 'Wien'"),
     page_limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=50),
@@ -31,11 +80,32 @@ def karriere_search(
     if API_TOKEN and token != API_TOKEN:
         raise HTTPException(status_code=401, detail="Invalid token")
     try:
-        return scrape_karriere(field=field, region=region, page_limit=page_limit, max_jobs=max_jobs)
+        return await _run_scrape(field, region, page_limit, max_jobs)
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-from urllib.parse import unquote
-@app.get("/url={raw}")
+
+@app.get("/karriere/search/stream")
+async def karriere_search_stream(
+    field: str = Query(..., description="e.g., 'IT, EDV'"),
+    region: str = Query(..., description="e.g., 'Wien'"),
+    page_limit: int = Query(DEFAULT_PAGE_LIMIT, ge=1, le=50),
+    max_jobs: int | None = Query(None, ge=1, le=2000),
+    token: str | None = Header(None, convert_underscores=False)
+):
+    if API_TOKEN and token != API_TOKEN:
+        raise HTTPException(status_code=401, detail="Invalid token")
+    # One JSON object per line, written as each job is scraped. The status line is long gone
+    # by the time a scrape can fail, so a failure is reported as a final {"error": ...} line.
+    async def ndjson():
+        try:
+            async for job in yield_jobs(field=field, region=region, page_limit=page_limit, max_jobs=max_jobs):
+                yield orjson.dumps(job) + b"\n"
+        except Exception as e:
+            yield orjson.dumps({"error": str(e)}) + b"\n"
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+# Registered last so the search routes are matched first
+@app.get("/proxy/{raw:path}")
 def proxy_style(raw: str, token: str | None = Header(None, convert_underscores=False)):
     if API_TOKEN and token != API_TOKEN:
         raise HTTPException(status_code=401, detail="Invalid token")
@@ -1,18 +1,61 @@
 # karriere_scraper.py
-import os, re, time
-from typing import List, Dict, Optional
-from datetime import datetime
-from urllib.parse import quote
+import os, re, time, asyncio, queue, sqlite3, threading, fcntl, itertools
+import multiprocessing.util
+from html import unescape
+from typing import IO, AsyncIterator, List, Dict, Optional, Tuple
+from urllib.parse import quote, urljoin
 
+import httpx
+import orjson
+from lxml import html as lxml_html
+from lxml.etree import ParserError
+from selectolax.parser import HTMLParser
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from selenium.common.exceptions import JavascriptException, TimeoutException, WebDriverException
 
 DEFAULT_TIMEOUT = int(os.getenv("SEL_TIMEOUT_SEC", "20"))
+HTTP_CONCURRENCY = int(os.getenv("HTTP_CONCURRENCY", "16"))
+HTTP_RETRIES = int(os.getenv("HTTP_RETRIES", "2"))
+SELENIUM_TABS = int(os.getenv("SELENIUM_TABS", "4"))
+POOL_SIZE = int(os.getenv("POOL_SIZE", "4"))
+# Chrome leaks memory over long sessions; recycle a pooled driver after this many scrapes
+DRIVER_MAX_USES = int(os.getenv("DRIVER_MAX_USES", "50"))
+CHROME_PROFILE_DIR = os.getenv("CHROME_PROFILE_DIR", "/tmp/karriere-profile")
+CACHE_DB = os.getenv("CACHE_DB", "/tmp/karriere-jobs.sqlite3")
+CACHE_TTL_SEC = int(os.getenv("CACHE_TTL_SEC", "86400"))
 BASE_URL = "https://www.karriere.at/jobs"
+# Nothing we read needs images, fonts, styles or trackers; block them at the network layer
+BLOCKED_URLS = [
+    "*.png", "*.jpg", "*.jpeg", "*.webp", "*.gif", "*.svg", "*.woff*", "*.css",
+    "*googletagmanager*", "*google-analytics*", "*onetrust*", "*doubleclick*", "*hotjar*",
+]
+# canonical detail pages like .../jobs/7605540
+_JOB_URL = re.compile(r"/jobs/\d+(?:[/?#].*)?$")
+_JOB_ID = re.compile(r"/jobs/(\d+)")
+_WS = re.compile(r"\s+")
+USER_AGENT = os.getenv(
+    "HTTP_USER_AGENT",
+    "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/128.0 Safari/537.36"
+)
+
+# Chrome locks its profile dir, so each live driver claims a numbered slot by flock-ing
+# <slot>.lock next to it. The flock is exclusive across threads and processes and dies with
+# the process, so slots are reused by recycled drivers and after restarts, and the number
+# of profile dirs never exceeds the peak number of concurrent drivers.
+_profile_locks: Dict[int, IO] = {}
+
+def _claim_profile_dir() -> Tuple[str, IO]:
+    os.makedirs(CHROME_PROFILE_DIR, exist_ok=True)
+    for slot in itertools.count():
+        lock = open(os.path.join(CHROME_PROFILE_DIR, f"{slot}.lock"), "w")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock.close()
+            continue
+        return os.path.join(CHROME_PROFILE_DIR, str(slot)), lock
 
 def _build_driver() -> webdriver.Chrome:
     opts = Options()
@@ -23,41 +66,172 @@ def _build_driver() -> webdriver.Chrome:
     for a in chrome_args:
         if a.strip():
             opts.add_argument(a.strip())
-    driver = webdriver.Chrome(options=opts)
-    driver.set_page_load_timeout(DEFAULT_TIMEOUT)
+    opts.add_argument("--blink-settings=imagesEnabled=false")
+    opts.add_experimental_option("prefs", {"profile.managed_default_content_settings.images": 2})
+    # chromedriver must not wait on pending navigations between commands, or the tabs in
+    # _extract_jobs_in_tabs would load one after another; readiness is polled explicitly,
+    # so _wait_page_ready's SEL_TIMEOUT_SEC is the only page-load timeout
+    opts.page_load_strategy = "none"
+    profile_dir, lock = _claim_profile_dir()
+    opts.add_argument(f"--user-data-dir={profile_dir}")
+    try:
+        driver = webdriver.Chrome(options=opts)
+    except Exception:
+        lock.close()
+        raise
+    _profile_locks[id(driver)] = lock
+    # Explicit waits only; an implicit wait would stack on top of every find_elements miss
+    driver.implicitly_wait(0)
+    _block_resources(driver)
+    _preload_consent(driver)
     return driver
 
-def _wait_css(driver, css, timeout=None):
-    WebDriverWait(driver, timeout or DEFAULT_TIMEOUT).until(
-        EC.presence_of_element_located((By.CSS_SELECTOR, css))
-    )
+def _block_resources(driver) -> None:
+    # CDP network state is per tab, so every new tab needs this too
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": BLOCKED_URLS})
 
-def _visible_text(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "")).strip()
+def _preload_consent(driver) -> None:
+    # Set the OneTrust consent cookies up front so the banner is never rendered;
+    # CDP can set them without first navigating to karriere.at
+    accepted_at = time.strftime("%Y-%m-%dT%H:%M:%S.000Z", time.gmtime())
+    for name, value in (
+        ("OptanonAlertBoxClosed", accepted_at),
+        ("OptanonConsent", "groups=C0001:1,C0002:1,C0003:1,C0004:1"),
+    ):
+        driver.execute_cdp_cmd("Network.setCookie", {
+            "name": name, "value": value, "domain": ".karriere.at", "path": "/", "secure": True,
+        })
+
+# --- Driver pool: browsers reused across scrapes, built on first use ---
+# The queue holds idle drivers only; _pool_live counts idle + borrowed ones and never
+# exceeds the pool size. A driver that dies or is recycled is dropped rather than replaced,
+# and the next acquire builds a new one, so a failed Chrome launch surfaces as an error
+# instead of an empty queue.
+DRIVER_POOL: "queue.Queue[webdriver.Chrome]" = queue.Queue()
+_driver_uses: Dict[int, int] = {}
+_pool_enabled = False
+_pool_size = 0
+_pool_live = 0
+_pool_lock = threading.Lock()
 
-def _accept_cookies_if_present(driver):
-    # Try common consent buttons on karriere.at / OneTrust variants
+def _quit_driver(driver) -> None:
+    _driver_uses.pop(id(driver), None)
     try:
-        # OneTrust default id
-        btn = WebDriverWait(driver, 3).until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "#onetrust-accept-btn-handler"))
-        )
-        btn.click()
-        time.sleep(0.3)
-        return
+        driver.quit()
     except Exception:
         pass
-    # Text-based fallbacks (German/English)
-    for text in ["Akzeptieren", "Zustimmen", "Alle akzeptieren", "Accept", "I agree"]:
+    lock = _profile_locks.pop(id(driver), None)
+    if lock is not None:
+        lock.close()
+
+def init_driver_pool(size: int = POOL_SIZE) -> None:
+    global _pool_enabled, _pool_size
+    _pool_size = size
+    _pool_enabled = True
+
+def close_driver_pool() -> None:
+    global _pool_enabled, _pool_live
+    _pool_enabled = False
+    while True:
+        try:
+            driver = DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            break
+        _quit_driver(driver)
+    with _pool_lock:
+        _pool_live = 0
+
+def _acquire_driver() -> webdriver.Chrome:
+    global _pool_live
+    # Without an initialized pool (e.g. library use) fall back to one driver per call
+    if not _pool_enabled:
+        return _build_driver()
+    while True:
+        try:
+            return DRIVER_POOL.get_nowait()
+        except queue.Empty:
+            pass
+        with _pool_lock:
+            if _pool_live < _pool_size:
+                _pool_live += 1
+                break
+        # Every driver is borrowed; wait for one to come back, re-checking for room
+        # in case a borrower dropped a dead driver instead
         try:
-            btn = WebDriverWait(driver, 2).until(
-                EC.element_to_be_clickable((By.XPATH, f"//button[contains(., '{text}')]"))
-            )
-            btn.click()
-            time.sleep(0.3)
+            return DRIVER_POOL.get(timeout=0.5)
+        except queue.Empty:
+            continue
+    try:
+        return _build_driver()
+    except Exception:
+        with _pool_lock:
+            _pool_live -= 1
+        raise
+
+def _release_driver(driver) -> None:
+    global _pool_live
+    if not _pool_enabled:
+        _quit_driver(driver)
+        return
+    uses = _driver_uses.get(id(driver), 0) + 1
+    if uses < DRIVER_MAX_USES:
+        try:
+            driver.delete_all_cookies()
+            _preload_consent(driver)
+            _driver_uses[id(driver)] = uses
+            DRIVER_POOL.put(driver)
             return
         except Exception:
-            continue
+            pass  # driver is dead; drop it
+    _quit_driver(driver)
+    with _pool_lock:
+        _pool_live -= 1
+
+# --- Job cache: postings barely change once published, so key them by job id ---
+_cache: Optional[sqlite3.Connection] = None
+
+def init_job_cache(path: str = CACHE_DB) -> None:
+    global _cache
+    conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE IF NOT EXISTS jobs(id INTEGER PRIMARY KEY, fetched_at INTEGER, payload BLOB)")
+    _cache = conn
+
+def close_job_cache() -> None:
+    global _cache
+    if _cache is not None:
+        _cache.close()
+        _cache = None
+
+def _job_id(url: str) -> Optional[int]:
+    m = _JOB_ID.search(url)
+    return int(m.group(1)) if m else None
+
+def _cache_get(url: str) -> Optional[Dict]:
+    jid = _job_id(url)
+    if _cache is None or jid is None:
+        return None
+    row = _cache.execute(
+        "SELECT payload FROM jobs WHERE id=? AND fetched_at>?", (jid, int(time.time()) - CACHE_TTL_SEC)
+    ).fetchone()
+    if row is None:
+        return None
+    job = orjson.loads(row[0])
+    job["link"] = url
+    return job
+
+def _cache_put(url: str, job: Dict) -> None:
+    jid = _job_id(url)
+    if _cache is None or jid is None:
+        return
+    _cache.execute(
+        "INSERT OR REPLACE INTO jobs(id, fetched_at, payload) VALUES (?, ?, ?)",
+        (jid, int(time.time()), orjson.dumps(job)),
+    )
+
+def _visible_text(s: str) -> str:
+    return _WS.sub(" ", (s or "")).strip()
 
 def _search_url(field: str, region: str, page: int = 1) -> str:
     # Simple & robust approach; adjust if site expects slugs
@@ -68,146 +242,356 @@ def _search_url(field: str, region: str, page: int = 1) -> str:
         url += f"?page={page}"
     return url
 
-def _collect_job_links_on_page(driver) -> List[str]:
-    import re
-    anchors = driver.find_elements(By.CSS_SELECTOR, 'a[href*="/jobs/"]')
+def _collect_job_links(html: str, base_url: str = BASE_URL) -> List[str]:
+    if not html.strip():
+        return []
+    hrefs = lxml_html.fromstring(html).xpath('//a[contains(@href, "/jobs/")]/@href')
     links, seen = [], set()
-    for a in anchors:
-        href = a.get_attribute("href")
-        if not href:
-            continue
-        # keep only canonical detail pages like .../jobs/7605540
-        if re.search(r"/jobs/\d+(?:[/?#].*)?$", href) and href not in seen:
+    for href in hrefs:
+        href = urljoin(base_url, href)
+        if _JOB_URL.search(href) and href not in seen:
             seen.add(href)
             links.append(href)
     return links
 
 
-def _extract_job(driver, url: str) -> Optional[Dict]:
-    import json, re
-    from html import unescape
-    try:
-        driver.get(url)
-        _wait_css(driver, "body")
-
-        # --- Prefer JSON-LD (JobPosting) ---
-        org = title = location = description = posted_at = None
-
-        scripts = driver.find_elements(By.CSS_SELECTOR, 'script[type="application/ld+json"]')
-        for s in scripts:
-            try:
-                raw = s.get_attribute("textContent") or s.get_attribute("innerHTML") or ""
-                raw = raw.strip()
-                if not raw:
-                    continue
-                data = json.loads(raw)
-                # JSON-LD can be dict or list; normalize to list
-                candidates = data if isinstance(data, list) else [data]
-                for item in candidates:
-                    if not isinstance(item, dict):
-                        continue
-                    # Some pages wrap JobPosting in @graph
-                    graph = item.get("@graph") if "@graph" in item else None
-                    if isinstance(graph, list):
-                        for g in graph:
-                            if isinstance(g, dict) and g.get("@type") == "JobPosting":
-                                item = g
-                                break
-                    if item.get("@type") == "JobPosting":
-                        title = item.get("title") or title
-                        posted_at = item.get("datePosted") or posted_at
-                        # Company
-                        org_obj = item.get("hiringOrganization") or {}
-                        if isinstance(org_obj, dict):
-                            org = org_obj.get("name") or org
-                        # Location
-                        loc_obj = item.get("jobLocation") or {}
-                        # jobLocation can be list or dict
-                        if isinstance(loc_obj, list) and loc_obj:
-                            loc_obj = loc_obj[0]
-                        if isinstance(loc_obj, dict):
-                            addr = loc_obj.get("address") or {}
-                            if isinstance(addr, dict):
-                                location = addr.get("addressLocality") or addr.get("addressRegion") or location
-                        # Description (strip HTML tags crudely)
-                        desc_html = item.get("description") or ""
-                        if desc_html:
-                            description = _visible_text(re.sub(r"<[^>]+>", " ", unescape(desc_html)))
+def _parse_job_posting(blobs) -> Optional[Dict]:
+    # Walk decoded JSON-LD blobs; None if no JobPosting is present
+    for data in blobs:
+        # JSON-LD can be dict or list; normalize to list
+        candidates = data if isinstance(data, list) else [data]
+        for item in candidates:
+            if not isinstance(item, dict):
+                continue
+            # Some pages wrap JobPosting in @graph
+            graph = item.get("@graph") if "@graph" in item else None
+            if isinstance(graph, list):
+                for g in graph:
+                    if isinstance(g, dict) and g.get("@type") == "JobPosting":
+                        item = g
                         break
-            except Exception:
+            if item.get("@type") != "JobPosting":
                 continue
+            org = location = description = None
+            # Company
+            org_obj = item.get("hiringOrganization") or {}
+            if isinstance(org_obj, dict):
+                org = org_obj.get("name")
+            # Location
+            loc_obj = item.get("jobLocation") or {}
+            # jobLocation can be list or dict
+            if isinstance(loc_obj, list) and loc_obj:
+                loc_obj = loc_obj[0]
+            if isinstance(loc_obj, dict):
+                addr = loc_obj.get("address") or {}
+                if isinstance(addr, dict):
+                    location = addr.get("addressLocality") or addr.get("addressRegion")
+            # Description: parse once and take the text (entities decoded in the same pass)
+            desc_html = item.get("description") or ""
+            if desc_html and isinstance(desc_html, str):
+                # Some postings ship entity-encoded markup (&lt;p&gt;...); decode it into real tags first
+                if "<" not in desc_html:
+                    desc_html = unescape(desc_html)
+                description = _WS.sub(" ", HTMLParser(desc_html).text(separator=" ")).strip()
+            return {
+                "title": item.get("title"),
+                "company": org,
+                "location": location,
+                "posted_at": item.get("datePosted"),
+                "description": description
+            }
+    return None
+
+
+# Returned for pages that can't yield a job at all (expired posting, persistent 429/5xx,
+# network failure); rendering those in Chrome would only scrape the error page
+_SKIP = object()
+
+
+async def _extract_job_http(url: str, client: httpx.AsyncClient):
+    # Static HTML is enough for JSON-LD; None tells the caller to fall back to Selenium
+    for attempt in range(HTTP_RETRIES + 1):
+        try:
+            r = await client.get(url)
+        except httpx.HTTPError:
+            return _SKIP
+        if r.status_code != 429 and r.status_code < 500:
+            break
+        if attempt < HTTP_RETRIES:
+            retry_after = r.headers.get("Retry-After", "")
+            await asyncio.sleep(min(int(retry_after), DEFAULT_TIMEOUT) if retry_after.isdigit() else 2 ** attempt)
+    if not r.is_success:
+        return _SKIP
+    try:
+        doc = lxml_html.fromstring(r.content)
+    except ParserError:
+        return None  # empty body
+    blobs = []
+    for raw in doc.xpath('//script[@type="application/ld+json"]/text()'):
+        raw = raw.strip()
+        if not raw:
+            continue
+        try:
+            blobs.append(orjson.loads(raw))
+        except orjson.JSONDecodeError:
+            continue
+    posting = _parse_job_posting(blobs)
+    if posting is None:
+        return None
+    return {
+        "title": posting["title"],
+        "company": posting["company"],
+        "location": posting["location"],
+        "posted_at": posting["posted_at"],
+        "link": url,
+        "description": posting["description"]
+    }
 
-        # --- Fallbacks via CSS if JSON-LD missing/partial ---
-        if not title:
-            els = driver.find_elements(By.CSS_SELECTOR, 'h1,[data-qa="job-title"], h1[class*="title"]')
-            if els: title = _visible_text(els[0].text)
-
-        if not org:
-            els = driver.find_elements(By.CSS_SELECTOR, '[data-qa="company-name"], a[href*="/firmen/"], .job-company, [itemprop="hiringOrganization"]')
-            if els: org = _visible_text(els[0].text)
-
-        if not location:
-            els = driver.find_elements(By.CSS_SELECTOR, '[data-qa="job-location"], .job-location, [itemprop="addressLocality"], [data-qa="locations"]')
-            if els: location = _visible_text(els[0].text)
-
-        if not description:
-            els = driver.find_elements(By.CSS_SELECTOR, '[data-qa="job-description"], article, .job-description, [itemprop="description"]')
-            if els: description = _visible_text(els[0].text)
-
-        if not posted_at:
-            els = driver.find_elements(By.CSS_SELECTOR, 'time[datetime], [data-qa="job-posted"], .posted-date')
-            if els:
-                posted_at = (els[0].get_attribute("datetime") or els[0].text or "").strip()
-
-        return {
-            "title": title,
-            "company": org,
-            "location": location,
-            "posted_at": posted_at,
-            "link": url,
-            "description": description
-        }
+
+def _http_client() -> httpx.AsyncClient:
+    # One client per scrape: HTTP/2 multiplexes all detail fetches over a single TLS connection
+    return httpx.AsyncClient(
+        http2=True,
+        headers={"User-Agent": USER_AGENT},
+        timeout=DEFAULT_TIMEOUT,
+        follow_redirects=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=32),
+    )
+
+
+async def _extract_jobs_http(links: List[str], client: httpx.AsyncClient) -> AsyncIterator[Tuple[str, Optional[Dict]]]:
+    sem = asyncio.Semaphore(HTTP_CONCURRENCY)
+
+    async def one(link: str) -> Tuple[str, Optional[Dict]]:
+        job = _cache_get(link)
+        if job is not None:
+            return link, job
+        async with sem:
+            job = await _extract_job_http(link, client)
+        if job is not None and job is not _SKIP:
+            _cache_put(link, job)
+        return link, job
+
+    # Hand results back as they finish so callers can stream them. If the caller stops early
+    # or a fetch raises, cancel the rest before the client they share is closed.
+    tasks = [asyncio.create_task(one(link)) for link in links]
+    try:
+        for fut in asyncio.as_completed(tasks):
+            yield await fut
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+JS_LD_JSON = """
+const out = [];
+for (const s of document.querySelectorAll('script[type="application/ld+json"]')) {
+    try { out.push(JSON.parse(s.textContent)); } catch (e) {}
+}
+return out;
+"""
+
+# Fallback selectors per field, comma-joined so the browser resolves each list in one querySelector
+FALLBACK_CSS = {
+    "title": 'h1, [data-qa="job-title"], h1[class*="title"]',
+    "org": '[data-qa="company-name"], a[href*="/firmen/"], .job-company, [itemprop="hiringOrganization"]',
+    "loc": '[data-qa="job-location"], .job-location, [itemprop="addressLocality"], [data-qa="locations"]',
+    "desc": '[data-qa="job-description"], article, .job-description, [itemprop="description"]',
+    "posted": 'time[datetime], [data-qa="job-posted"], .posted-date',
+}
+
+# First match per field, whitespace collapsed in-page; mirrors _visible_text
+JS_EXTRACT = """
+const sel = arguments[0];
+const q = (s) => { const e = document.querySelector(s); return e ? (e.innerText || e.textContent || '').replace(/\\s+/g, ' ').trim() : null; };
+const t = (s) => { const e = document.querySelector(s); return e ? (e.getAttribute('datetime') || e.textContent || '').trim() : null; };
+return {title: q(sel.title), org: q(sel.org), loc: q(sel.loc), desc: q(sel.desc), posted: t(sel.posted)};
+"""
+
+
+JOB_READY_CSS = 'script[type="application/ld+json"], h1'
+# Tabs are navigated without blocking; a marker on the old document tells us the new one has replaced it
+JS_NAVIGATE = "window.__kjStale = true; window.location.href = arguments[0];"
+JS_PAGE_READY = (
+    "return !window.__kjStale && document.readyState !== 'loading'"
+    " && document.querySelector(arguments[0]) !== null;"
+)
+
+
+def _wait_page_ready(driver) -> None:
+    # Move on as soon as the new document is parsed and holds the data we read;
+    # scripts can fail while the old document is being swapped out, so keep polling
+    WebDriverWait(driver, DEFAULT_TIMEOUT, poll_frequency=0.1, ignored_exceptions=(JavascriptException,)).until(
+        lambda d: d.execute_script(JS_PAGE_READY, JOB_READY_CSS)
+    )
+
+
+def _read_job(driver, url: str) -> Dict:
+    # --- Prefer JSON-LD (JobPosting) ---
+    org = title = location = description = posted_at = None
+
+    # One roundtrip: parse every JSON-LD block in the page and return them together
+    blobs = driver.execute_script(JS_LD_JSON) or []
+    posting = _parse_job_posting(blobs)
+    if posting:
+        title = posting["title"]
+        org = posting["company"]
+        location = posting["location"]
+        description = posting["description"]
+        posted_at = posting["posted_at"]
+
+    # --- Fallbacks via CSS if JSON-LD missing/partial (one roundtrip for all fields) ---
+    if not (title and org and location and description and posted_at):
+        css = driver.execute_script(JS_EXTRACT, FALLBACK_CSS) or {}
+        title = title or css.get("title")
+        org = org or css.get("org")
+        location = location or css.get("loc")
+        description = description or css.get("desc")
+        posted_at = posted_at or css.get("posted")
+
+    return {
+        "title": title,
+        "company": org,
+        "location": location,
+        "posted_at": posted_at,
+        "link": url,
+        "description": description
+    }
+
+
+def _extract_job(driver, url: str) -> Optional[Dict]:
+    try:
+        driver.execute_script(JS_NAVIGATE, url)
+        _wait_page_ready(driver)
+        return _read_job(driver, url)
     except TimeoutException:
         return None
 
 
-def scrape_karriere(field: str, region: str, page_limit: int = 3, max_jobs: Optional[int] = None) -> Dict:
-    """
-    Crawl up to page_limit result pages for (field, region) and return structured jobs.
-    """
-    driver = _build_driver()
-    jobs: List[Dict] = []
+def _extract_jobs_in_tabs(driver, urls: List[str]) -> List[Optional[Dict]]:
+    # One browser, several tabs loading at once: the loads overlap on the network
+    # instead of paying each page's latency in turn
+    tabs = min(SELENIUM_TABS, len(urls))
+    if tabs <= 1:
+        return [_extract_job(driver, url) for url in urls]
+    main = driver.current_window_handle
+    handles = [main]
+    results: List[Optional[Dict]] = []
     try:
-        driver.get(_search_url(field, region, page=1))
-        _accept_cookies_if_present(driver)
-        _wait_css(driver, "body")
-
-        page = 1
-        while page <= page_limit:
-            if page > 1:
-                driver.get(_search_url(field, region, page=page))
-                _wait_css(driver, "body")
-
-            links = _collect_job_links_on_page(driver)
-            for link in links:
-                job = _extract_job(driver, link)
-                if job:
-                    jobs.append(job)
-                    if max_jobs and len(jobs) >= max_jobs:
-                        break
-            if max_jobs and len(jobs) >= max_jobs:
-                break
-            page += 1
-
-        return {
-            "field": field,
-            "region": region,
-            "count": len(jobs),
-            "jobs": jobs,
-            "meta": {"ts": int(datetime.utcnow().timestamp())}
-        }
+        for _ in range(tabs - 1):
+            driver.switch_to.new_window("tab")
+            _block_resources(driver)
+            handles.append(driver.current_window_handle)
+        for i in range(0, len(urls), tabs):
+            batch = list(zip(handles, urls[i:i + tabs]))
+            for handle, url in batch:
+                driver.switch_to.window(handle)
+                driver.execute_script(JS_NAVIGATE, url)
+            for handle, url in batch:
+                driver.switch_to.window(handle)
+                try:
+                    _wait_page_ready(driver)
+                    results.append(_read_job(driver, url))
+                except TimeoutException:
+                    results.append(None)
     finally:
+        # Best effort: on a dead driver this would only mask the original error,
+        # and the pool drops such drivers on release anyway
         try:
-            driver.quit()
-        except Exception:
+            for handle in handles[1:]:
+                driver.switch_to.window(handle)
+                driver.close()
+            driver.switch_to.window(main)
+        except WebDriverException:
             pass
+    return results
+
+
+def _build_result(field: str, region: str, jobs: List[Dict]) -> Dict:
+    return {
+        "field": field,
+        "region": region,
+        "count": len(jobs),
+        "jobs": jobs,
+        "meta": {"ts": int(time.time())}
+    }
+
+
+async def yield_jobs(field: str, region: str, page_limit: int = 3, max_jobs: Optional[int] = None,
+                     ordered: bool = False) -> AsyncIterator[Dict]:
+    """
+    Crawl up to page_limit result pages for (field, region) and yield each job as soon as it is scraped.
+    With ordered=True jobs are held back per page and yielded in listing order instead.
+    """
+    count = 0
+    # Listing and detail pages go over plain HTTP; a driver is only borrowed
+    # if some detail page lacks JSON-LD
+    driver = None
+    try:
+        async with _http_client() as client:
+            for page in range(1, page_limit + 1):
+                r = await client.get(_search_url(field, region, page=page))
+                # e.g. 404 past the last result page: keep what we have
+                if not r.is_success:
+                    break
+                links = _collect_job_links(r.text, str(r.url))
+                if max_jobs:
+                    links = links[: max_jobs - count]
+                page_jobs: Dict[str, Dict] = {}
+                missing = []
+                async for link, job in _extract_jobs_http(links, client):
+                    if job is _SKIP:
+                        continue
+                    if job is None:
+                        missing.append(link)
+                    elif ordered:
+                        page_jobs[link] = job
+                    else:
+                        count += 1
+                        yield job
+                if missing:
+                    if driver is None:
+                        driver = await asyncio.to_thread(_acquire_driver)
+                    rendered = await asyncio.to_thread(_extract_jobs_in_tabs, driver, missing)
+                    for link, job in zip(missing, rendered):
+                        if not job:
+                            continue
+                        _cache_put(link, job)
+                        if ordered:
+                            page_jobs[link] = job
+                        else:
+                            count += 1
+                            yield job
+                for link in links:
+                    if link in page_jobs:
+                        count += 1
+                        yield page_jobs[link]
+                if max_jobs and count >= max_jobs:
+                    break
+    finally:
+        if driver is not None:
+            await asyncio.to_thread(_release_driver, driver)
+
+
+async def scrape_karriere(field: str, region: str, page_limit: int = 3, max_jobs: Optional[int] = None) -> Dict:
+    """
+    Crawl up to page_limit result pages for (field, region) and return structured jobs.
+    """
+    jobs = [job async for job in yield_jobs(field, region, page_limit=page_limit, max_jobs=max_jobs, ordered=True)]
+    return _build_result(field, region, jobs)
+
+
+# --- Process-pool workers: each process owns one persistent Chrome ---
+def init_worker() -> None:
+    # Chrome is only needed for pages without JSON-LD, so the worker's driver is built on
+    # first use; a failing launch then fails that scrape instead of breaking the executor
+    init_driver_pool(1)
+    init_job_cache()
+    # Executor workers exit without running atexit hooks; Finalize still fires
+    multiprocessing.util.Finalize(None, close_driver_pool, exitpriority=10)
+    multiprocessing.util.Finalize(None, close_job_cache, exitpriority=10)
+
+
+def scrape_karriere_using_worker_driver(field: str, region: str, page_limit: int = 3, max_jobs: Optional[int] = None) -> Dict:
+    return asyncio.run(scrape_karriere(field=field, region=region, page_limit=page_limit, max_jobs=max_jobs))